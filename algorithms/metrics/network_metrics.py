@@ -1,7 +1,51 @@
 import networkx as nx
-from typing import Optional
+import numpy as np
+from scipy.sparse import csr_matrix
+from scipy.sparse.csgraph import connected_components, shortest_path
+from typing import Optional, Tuple
 from core.directed_graph import DirectedEmailGraph
 
+# BFS sources per block in _largest_component_eccentricities (bounds memory)
+BFS_BLOCK_SIZE = 256
+
+
+def _largest_component_eccentricities(graph: DirectedEmailGraph) -> np.ndarray:
+    """
+    Get eccentricity of every node in the largest connected component.
+    
+    Edges are treated as undirected. Runs SciPy's compiled BFS over the
+    graph's CSR view, a block of sources at a time.
+    
+    Args:
+        graph: DirectedEmailGraph instance
+    
+    Returns:
+        Array of eccentricities (empty if graph has no nodes)
+    """
+    nodes, indptr, indices, _ = graph.to_csr()
+    n = len(nodes)
+    if n == 0:
+        return np.zeros(0, dtype=np.int64)
+    
+    adjacency = csr_matrix((np.ones(len(indices)), indices, indptr), shape=(n, n))
+    
+    # Labels follow node order, so ties go to the same component as NetworkX
+    _, labels = connected_components(adjacency, directed=False)
+    largest = np.flatnonzero(labels == np.bincount(labels).argmax())
+    component = adjacency[largest][:, largest]
+    
+    size = len(largest)
+    eccentricities = np.empty(size, dtype=np.int64)
+    for start in range(0, size, BFS_BLOCK_SIZE):
+        stop = min(start + BFS_BLOCK_SIZE, size)
+        distances = shortest_path(
+            component, directed=False, unweighted=True,
+            indices=np.arange(start, stop)
+        )
+        eccentricities[start:stop] = distances.max(axis=1)
+    
+    return eccentricities
+
 
 def network_density(graph: DirectedEmailGraph) -> float:
     """
@@ -21,8 +65,10 @@ def network_density(graph: DirectedEmailGraph) -> float:
     Returns:
         Network density (0 to 1)
     """
-    nx_graph = graph.to_networkx()
-    return nx.density(nx_graph)
+    num_nodes = graph.get_number_of_nodes()
+    if num_nodes <= 1:
+        return 0
+    return graph.get_number_of_edges() / (num_nodes * (num_nodes - 1))
 
 
 def diameter(graph: DirectedEmailGraph) -> Optional[int]:
@@ -43,21 +89,10 @@ def diameter(graph: DirectedEmailGraph) -> Optional[int]:
     Returns:
         Diameter value or None if graph not connected
     """
-    nx_graph = graph.to_networkx()
-    
-    # Convert to undirected for diameter calculation
-    undirected = nx_graph.to_undirected()
-    
-    # Check if connected
-    if not nx.is_connected(undirected):
-        # For disconnected graphs, get diameter of largest component
-        largest_cc = max(nx.connected_components(undirected), key=len)
-        subgraph = undirected.subgraph(largest_cc)
-        if len(subgraph) > 1:
-            return nx.diameter(subgraph)
+    eccentricities = _largest_component_eccentricities(graph)
+    if len(eccentricities) == 0:
         return 0
-    
-    return nx.diameter(undirected)
+    return int(eccentricities.max())
 
 
 def radius(graph: DirectedEmailGraph) -> Optional[int]:
@@ -83,19 +118,28 @@ def radius(graph: DirectedEmailGraph) -> Optional[int]:
     Returns:
         Network radius or None if graph not connected
     """
-    nx_graph = graph.to_networkx()
-    undirected = nx_graph.to_undirected()
-    
-    # Check if connected
-    if not nx.is_connected(undirected):
-        # For disconnected graphs, use largest component
-        largest_cc = max(nx.connected_components(undirected), key=len)
-        subgraph = undirected.subgraph(largest_cc)
-        if len(subgraph) > 1:
-            return nx.radius(subgraph)
+    eccentricities = _largest_component_eccentricities(graph)
+    if len(eccentricities) == 0:
         return 0
+    return int(eccentricities.min())
+
+
+def diameter_and_radius(graph: DirectedEmailGraph) -> Tuple[int, int]:
+    """
+    Calculate diameter and radius from a single eccentricity sweep.
+    
+    Same values as diameter() and radius(), for callers that need both.
+    
+    Args:
+        graph: DirectedEmailGraph instance
     
-    return nx.radius(undirected)
+    Returns:
+        Tuple (diameter, radius); (0, 0) for an empty graph
+    """
+    eccentricities = _largest_component_eccentricities(graph)
+    if len(eccentricities) == 0:
+        return 0, 0
+    return int(eccentricities.max()), int(eccentricities.min())
 
 
 def average_shortest_path_length(graph: DirectedEmailGraph) -> Optional[float]:
@@ -189,9 +233,8 @@ def average_degree(graph: DirectedEmailGraph) -> float:
     Returns:
         Average degree (including both in-degree and out-degree)
     """
-    nx_graph = graph.to_networkx()
-    num_nodes = nx_graph.number_of_nodes()
-    num_edges = nx_graph.number_of_edges()
+    num_nodes = graph.get_number_of_nodes()
+    num_edges = graph.get_number_of_edges()
     
     if num_nodes == 0:
         return 0
@@ -230,13 +273,14 @@ def get_all_metrics(graph: DirectedEmailGraph) -> dict:
     Returns:
         Dictionary with all metrics
     """
+    graph_diameter, graph_radius = diameter_and_radius(graph)
     return {
         'num_nodes': graph.get_number_of_nodes(),
         'num_edges': graph.get_number_of_edges(),
         'average_degree': average_degree(graph),
         'density': network_density(graph),
-        'diameter': diameter(graph),
-        'radius': radius(graph),
+        'diameter': graph_diameter,
+        'radius': graph_radius,
         'average_path_length': average_shortest_path_length(graph),
         'average_clustering': average_clustering_coefficient(graph),
         'triangles': number_of_triangles(graph),
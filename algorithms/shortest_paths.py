@@ -1,4 +1,8 @@
+import heapq
+import math
 import networkx as nx
+from scipy.sparse import csr_matrix
+from scipy.sparse.csgraph import connected_components
 from typing import List, Tuple, Optional
 from core.directed_graph import DirectedEmailGraph
 
@@ -31,54 +35,196 @@ def dijkstra_shortest_path(
         # path = ['spam@example.com', 'relay@example.com', 'victim@example.com']
         # distance = 150 (total emails)
     """
-    nx_graph = graph.to_networkx()
+    path_index = build_path_index(graph, weight_type)
+    return dijkstra_indexed(path_index, source, target)
+
+
+def build_path_index(
+    graph: DirectedEmailGraph,
+    weight_type: str = 'inverse'
+) -> dict:
+    """
+    Precompute sparse matrices for repeated shortest path queries.
     
-    # Check if nodes exist
-    if source not in nx_graph or target not in nx_graph:
-        return None, None
+    Build once per loaded dataset and pass to dijkstra_indexed(), so each
+    query searches plain adjacency lists instead of copying the graph.
     
-    # Check if target is reachable from source
-    if not nx.has_path(nx_graph, source, target):
-        return None, None
+    Args:
+        graph: DirectedEmailGraph instance
+        weight_type: How to interpret edge weights (see dijkstra_shortest_path)
+    
+    Returns:
+        Dictionary with:
+        - nodes: List of nodes (matrix index → node)
+        - index: Dictionary mapping node → matrix index
+        - forward: (indptr, indices, costs) lists for outgoing edges
+        - weights: Original weight of each edge in forward order
+        - reverse: The same lists for incoming edges
+        - components: Weakly connected component label per node
+    """
+    nodes, indptr, indices, raw = graph.to_csr()
+    index = {node: i for i, node in enumerate(nodes)}
+    n = len(nodes)
+    
+    if weight_type == 'inverse':
+        # Lower email count = shorter distance
+        # Transform weights: distance = max_weight + 1 - weight (always >= 1)
+        max_weight = raw.max() if len(raw) else 0
+        costs = max_weight + 1 - raw
+    else:
+        costs = raw
     
-    try:
-        if weight_type == 'inverse':
-            # Lower email count = shorter distance
-            # Transform weights: distance = 1 / weight
-            # To avoid division issues, use: distance = max_weight - weight
-            max_weight = 0
-            for u, v, data in nx_graph.edges(data=True):
-                w = data.get('weight', 1)
-                if w > max_weight:
-                    max_weight = w
-            
-            # Create new graph with inverted weights
-            inverted_graph = nx_graph.copy()
-            for u, v in inverted_graph.edges():
-                original_weight = inverted_graph[u][v].get('weight', 1)
-                # Inverse: high weight becomes low distance
-                inverted_graph[u][v]['weight'] = max_weight + 1 - original_weight
-            
-            path = nx.dijkstra_path(inverted_graph, source, target, weight='weight')
-            
-            # Calculate ACTUAL distance (sum of original weights along the path)
-            actual_distance = 0
-            for i in range(len(path) - 1):
-                edge_weight = nx_graph[path[i]][path[i+1]].get('weight', 1)
-                actual_distance += edge_weight
-            
-            return path, actual_distance
-        else:
-            # Use weights directly
-            path = nx.dijkstra_path(nx_graph, source, target, weight='weight')
-            distance = nx.dijkstra_path_length(nx_graph, source, target, weight='weight')
-            
-            return path, distance
-    
-    except nx.NetworkXNoPath:
+    forward = csr_matrix((costs, indices, indptr), shape=(n, n))
+    reverse = forward.transpose().tocsr()
+    _, components = connected_components(forward, directed=True, connection='weak')
+    
+    return {
+        'nodes': nodes,
+        'index': index,
+        'forward': (indptr.tolist(), indices.tolist(), costs.tolist()),
+        'reverse': (reverse.indptr.tolist(), reverse.indices.tolist(), reverse.data.tolist()),
+        'weights': [int(w) if w.is_integer() else w for w in raw.tolist()],
+        'components': components.tolist(),
+    }
+
+
+def same_component(path_index: dict, source: str, target: str) -> bool:
+    """
+    Check whether two nodes lie in the same weakly connected component.
+    
+    If not, no path exists in either direction and both searches can be
+    skipped. Constant time, using labels computed by build_path_index().
+    
+    Args:
+        path_index: Dictionary returned by build_path_index()
+        source: First node
+        target: Second node
+    
+    Returns:
+        True if the nodes are weakly connected
+    """
+    index = path_index['index']
+    components = path_index['components']
+    return components[index[source]] == components[index[target]]
+
+
+def bidirectional_search(
+    forward: tuple,
+    reverse: tuple,
+    src: int,
+    tgt: int
+) -> Optional[List[int]]:
+    """
+    Bidirectional Dijkstra between two node indices.
+    
+    Grows one search from src along outgoing edges and one from tgt along
+    incoming edges, always advancing the side with the nearer frontier.
+    Stops as soon as the two frontier minimums together reach the best
+    meeting cost, so only the neighbourhoods of both ends are explored.
+    
+    Args:
+        forward: (indptr, indices, costs) adjacency of outgoing edges
+        reverse: (indptr, indices, costs) adjacency of incoming edges
+        src: Index of the starting node
+        tgt: Index of the ending node
+    
+    Returns:
+        List of node indices from src to tgt, or None if no path exists
+    """
+    if src == tgt:
+        return [src]
+    
+    adjacency = (forward, reverse)
+    dists = ({src: 0}, {tgt: 0})
+    preds = ({src: None}, {tgt: None})
+    settled = (set(), set())
+    heaps = ([(0, src)], [(0, tgt)])
+    best = math.inf
+    meet = None
+    
+    while heaps[0] and heaps[1]:
+        if heaps[0][0][0] + heaps[1][0][0] >= best:
+            break
+        
+        side = 0 if heaps[0][0][0] <= heaps[1][0][0] else 1
+        dist, u = heapq.heappop(heaps[side])
+        if u in settled[side]:
+            continue
+        settled[side].add(u)
+        
+        indptr, indices, costs = adjacency[side]
+        own, other = dists[side], dists[1 - side]
+        for k in range(indptr[u], indptr[u + 1]):
+            v = indices[k]
+            candidate = dist + costs[k]
+            if candidate < own.get(v, math.inf):
+                own[v] = candidate
+                preds[side][v] = u
+                heapq.heappush(heaps[side], (candidate, v))
+            # Any edge touching the other search closes an src → tgt path
+            if v in other and own[v] + other[v] < best:
+                best = own[v] + other[v]
+                meet = v
+    
+    if meet is None:
+        return None
+    
+    # Stitch the two predecessor chains together at the meeting node
+    hops = []
+    node = meet
+    while node is not None:
+        hops.append(node)
+        node = preds[0][node]
+    hops.reverse()
+    node = preds[1][meet]
+    while node is not None:
+        hops.append(node)
+        node = preds[1][node]
+    return hops
+
+
+def dijkstra_indexed(
+    path_index: dict,
+    source: str,
+    target: str,
+    reverse: bool = False
+) -> Tuple[Optional[List[str]], Optional[float]]:
+    """
+    Find shortest path using a prebuilt path index.
+    
+    Args:
+        path_index: Dictionary returned by build_path_index()
+        source: Starting node
+        target: Ending node
+        reverse: If True, find the path from target back to source instead
+    
+    Returns:
+        Tuple (path_list, total_distance) with the same meaning as
+        dijkstra_shortest_path(). Returns (None, None) if no path exists
+    """
+    index = path_index['index']
+    if source not in index or target not in index:
         return None, None
-    except nx.NodeNotFound:
+    
+    src = index[source]
+    tgt = index[target]
+    if reverse:
+        src, tgt = tgt, src
+    
+    hops = bidirectional_search(path_index['forward'], path_index['reverse'], src, tgt)
+    if hops is None:
         return None, None
+    
+    # Report the ACTUAL distance (sum of original weights along the path);
+    # each hop's weight sits at the target's slot in the source's CSR row
+    indptr, indices, _ = path_index['forward']
+    weights = path_index['weights']
+    distance = sum(
+        weights[indices.index(v, indptr[u], indptr[u + 1])] for u, v in zip(hops, hops[1:])
+    )
+    
+    nodes = path_index['nodes']
+    return [nodes[i] for i in hops], distance
 
 
 def dijkstra_shortest_path_length(
@@ -1,4 +1,5 @@
 import networkx as nx
+import numpy as np
 from typing import Dict, List, Tuple, Optional
 
 
@@ -14,6 +15,7 @@ class DirectedEmailGraph:
     def __init__(self):
         """Initialize empty directed graph."""
         self.graph = nx.DiGraph()
+        self._csr = None
     
     def add_email(self, sender: str, recipient: str, weight: int = 1) -> None:
         """
@@ -27,6 +29,7 @@ class DirectedEmailGraph:
             recipient: Email address of recipient
             weight: Weight to add (default 1 for single email)
         """
+        self._csr = None
         if self.graph.has_edge(sender, recipient):
             # Increment existing edge weight
             current_weight = self.graph[sender][recipient].get('weight', 1)
@@ -45,6 +48,80 @@ class DirectedEmailGraph:
         for sender, recipient, weight in emails:
             self.add_email(sender, recipient, weight)
     
+    @classmethod
+    def from_arrays(
+        cls,
+        senders: np.ndarray,
+        recipients: np.ndarray,
+        weights: Optional[np.ndarray] = None
+    ) -> 'DirectedEmailGraph':
+        """
+        Build a graph from parallel sender/recipient arrays.
+        
+        Same result as add_emails_batch() on an empty graph (node and edge
+        order included), but duplicate pairs are merged and the CSR view
+        is built with NumPy rather than one dict update per email.
+        
+        Args:
+            senders: Array of sender addresses
+            recipients: Array of recipient addresses (same length)
+            weights: Email count per row (default 1 for each)
+        
+        Returns:
+            New DirectedEmailGraph
+        """
+        senders = np.asarray(senders, dtype=str)
+        recipients = np.asarray(recipients, dtype=str)
+        num_rows = len(senders)
+        if weights is None:
+            weights = np.ones(num_rows, dtype=np.int64)
+        
+        # Interleave endpoints so node ids follow add_email() insertion order
+        endpoints = np.empty(2 * num_rows, dtype=np.result_type(senders, recipients))
+        endpoints[0::2] = senders
+        endpoints[1::2] = recipients
+        unique, first_seen, inverse = np.unique(
+            endpoints, return_index=True, return_inverse=True
+        )
+        order = np.argsort(first_seen)
+        rank = np.empty(len(unique), dtype=np.int64)
+        rank[order] = np.arange(len(unique))
+        ids = rank[inverse.ravel()]
+        src = ids[0::2]
+        dst = ids[1::2]
+        n = len(unique)
+        
+        # Merge repeated (sender, recipient) pairs by summing their weights
+        edge_keys, edge_first, edge_inverse = np.unique(
+            src * n + dst, return_index=True, return_inverse=True
+        )
+        edge_weights = np.bincount(
+            edge_inverse.ravel(), weights=weights, minlength=len(edge_keys)
+        )
+        # Email counts are whole numbers; keep them integers unless a weight is fractional
+        if np.array_equal(edge_weights, np.trunc(edge_weights)):
+            edge_weights = edge_weights.astype(np.int64)
+        edge_src = edge_keys // n
+        edge_dst = edge_keys % n
+        
+        # Rows by sender; within a row, recipients in first-seen order
+        csr_order = np.lexsort((edge_first, edge_src))
+        indptr = np.zeros(n + 1, dtype=np.int32)
+        indptr[1:] = np.cumsum(np.bincount(edge_src, minlength=n))
+        indices = edge_dst[csr_order].astype(np.int32)
+        
+        nodes = unique[order].tolist()
+        insert_order = np.argsort(edge_first)
+        new_graph = cls()
+        new_graph.graph.add_nodes_from(nodes)
+        new_graph.graph.add_weighted_edges_from(zip(
+            [nodes[i] for i in edge_src[insert_order]],
+            [nodes[i] for i in edge_dst[insert_order]],
+            edge_weights[insert_order].tolist()
+        ))
+        new_graph._csr = (nodes, indptr, indices, edge_weights[csr_order].astype(np.float64))
+        return new_graph
+    
     def get_nodes(self) -> List[str]:
         """Get list of all nodes (email addresses)."""
         return list(self.graph.nodes())
@@ -168,6 +245,36 @@ class DirectedEmailGraph:
         """Get total number of edges."""
         return self.graph.number_of_edges()
     
+    def to_csr(self) -> Tuple[List[str], np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Get compressed sparse row (CSR) arrays of the graph.
+        
+        Row i holds the outgoing edges of nodes[i]: recipients are
+        indices[indptr[i]:indptr[i + 1]] with matching weights.
+        Built once and reused until the graph changes through add_email().
+        
+        Returns:
+            Tuple (nodes, indptr, indices, weights)
+        """
+        if self._csr is None:
+            nodes = list(self.graph.nodes())
+            index = {node: i for i, node in enumerate(nodes)}
+            adjacency = self.graph.adj
+            
+            indptr = np.zeros(len(nodes) + 1, dtype=np.int32)
+            indptr[1:] = np.cumsum([len(adjacency[node]) for node in nodes])
+            indices = np.fromiter(
+                (index[v] for node in nodes for v in adjacency[node]),
+                dtype=np.int32, count=indptr[-1]
+            )
+            weights = np.fromiter(
+                (d.get('weight', 1) for node in nodes for d in adjacency[node].values()),
+                dtype=np.float64, count=indptr[-1]
+            )
+            self._csr = (nodes, indptr, indices, weights)
+        
+        return self._csr
+    
     def to_networkx(self) -> nx.DiGraph:
         """
         Get underlying NetworkX DiGraph object.
@@ -1,5 +1,7 @@
 import csv
 import os
+import numpy as np
+import pandas as pd
 from typing import List, Tuple
 from utils.validators import validate_csv_format
 
@@ -83,6 +85,64 @@ class EmailParser:
         
         return emails
     
+    @staticmethod
+    def parse_csv_fast(filepath: str) -> pd.DataFrame:
+        """
+        Parse CSV file into a DataFrame using pandas' C parser.
+        
+        Applies the same rules as parse_csv() column-wise instead of
+        row by row (malformed rows are skipped without a warning).
+        
+        Args:
+            filepath: Path to CSV file
+        
+        Returns:
+            DataFrame with columns sender, recipient, count
+        
+        Raises:
+            ValueError: If CSV format is invalid
+            FileNotFoundError: If file not found
+        """
+        # Validate file exists
+        if not os.path.exists(filepath):
+            raise FileNotFoundError(f"File not found: {filepath}")
+        
+        # Validate CSV format
+        is_valid, error_msg = validate_csv_format(filepath)
+        if not is_valid:
+            raise ValueError(f"Invalid CSV format: {error_msg}")
+        
+        df = pd.read_csv(
+            filepath, dtype=str, na_filter=False, encoding='utf-8', on_bad_lines='skip'
+        )
+        
+        # Case-insensitive column names (first match wins, as in parse_csv)
+        columns = {}
+        for column in df.columns:
+            columns.setdefault(column.strip().lower(), column)
+        
+        sender = df[columns['sender']].str.strip()
+        recipient = df[columns['recipient']].str.strip()
+        
+        # Get count (optional): anything that is not an integer counts as 1
+        count_column = next(
+            (column for column in df.columns
+             if column.strip().lower() in ['count', 'frequency', 'number']), None
+        )
+        count = np.ones(len(df), dtype=np.int64)
+        if count_column is not None:
+            raw = df[count_column].str.strip()
+            is_int = raw.str.fullmatch(r'[+-]?\d+').to_numpy(dtype=bool)
+            count[is_int] = raw[is_int].astype(np.int64).to_numpy()
+        
+        emails = pd.DataFrame({'sender': sender, 'recipient': recipient, 'count': count})
+        emails = emails[(emails['sender'] != '') & (emails['recipient'] != '')]
+        
+        if emails.empty:
+            raise ValueError("No valid email records found in CSV")
+        
+        return emails.reset_index(drop=True)
+    
     @staticmethod
     def get_statistics(emails: List[Tuple[str, str, int]]) -> dict:
         """
@@ -1,3 +1,4 @@
+import numpy as np
 from typing import Dict, List
 from utils.config import SPAM_SCORE_THRESHOLD, SUSPICIOUS_SCORE_THRESHOLD
 
@@ -37,6 +38,19 @@ class SpamClassifier:
         else:
             return 'legitimate'
     
+    def classify_array(self, scores: np.ndarray) -> np.ndarray:
+        """
+        Classify many scores at once.
+        
+        Args:
+            scores: Array of spam scores (0-100)
+        
+        Returns:
+            Array of bucket indices: 0 = legitimate, 1 = suspicious, 2 = spam
+        """
+        thresholds = np.array([self.suspicious_threshold, self.spam_threshold], dtype=np.float64)
+        return np.searchsorted(thresholds, scores, side='right')
+    
     def classify_all_nodes(self, spam_scores: Dict[str, float]) -> Dict[str, str]:
         """
         Classify all nodes.
@@ -78,18 +92,18 @@ class SpamClassifier:
         Returns:
             Dictionary with counts of each classification
         """
-        spam = self.get_spam_nodes(spam_scores)
-        suspicious = self.get_suspicious_nodes(spam_scores)
-        legitimate = self.get_legitimate_nodes(spam_scores)
-        
         total = len(spam_scores)
+        scores = np.fromiter(spam_scores.values(), dtype=np.float64, count=total)
+        legitimate, suspicious, spam = (
+            int(count) for count in np.bincount(self.classify_array(scores), minlength=3)
+        )
         
         return {
-            'spam_count': len(spam),
-            'spam_percentage': (len(spam) / total * 100) if total > 0 else 0,
-            'suspicious_count': len(suspicious),
-            'suspicious_percentage': (len(suspicious) / total * 100) if total > 0 else 0,
-            'legitimate_count': len(legitimate),
-            'legitimate_percentage': (len(legitimate) / total * 100) if total > 0 else 0,
+            'spam_count': spam,
+            'spam_percentage': (spam / total * 100) if total > 0 else 0,
+            'suspicious_count': suspicious,
+            'suspicious_percentage': (suspicious / total * 100) if total > 0 else 0,
+            'legitimate_count': legitimate,
+            'legitimate_percentage': (legitimate / total * 100) if total > 0 else 0,
             'total_nodes': total,
         }
@@ -1,6 +1,8 @@
+import functools
 from typing import Dict
+import numpy as np
 from core.directed_graph import DirectedEmailGraph
-from algorithms.metrics.degree_stats import get_degree_ratio, get_out_degree, get_in_degree
+from algorithms.metrics.degree_stats import get_degree_ratio
 from utils.config import (
     MIN_SPAM_OUT_DEGREE, SPAM_SCORE_THRESHOLD
 )
@@ -18,9 +20,23 @@ class SpamScorer:
             graph: DirectedEmailGraph instance
         """
         self.graph = graph
-        self.degree_ratios = get_degree_ratio(graph)
-        self.out_degrees = get_out_degree(graph)
-        self.in_degrees = get_in_degree(graph)
+    
+    @functools.cached_property
+    def degree_ratios(self) -> Dict[str, float]:
+        """Out/in degree ratio per node, computed on first access."""
+        return get_degree_ratio(self.graph)
+    
+    @functools.cached_property
+    def out_degrees(self) -> Dict[str, int]:
+        """Out-degree per node, read from the CSR row lengths on first access."""
+        nodes, indptr, _, _ = self.graph.to_csr()
+        return dict(zip(nodes, np.diff(indptr).tolist()))
+    
+    @functools.cached_property
+    def in_degrees(self) -> Dict[str, int]:
+        """In-degree per node, counted from the CSR column indices on first access."""
+        nodes, _, indices, _ = self.graph.to_csr()
+        return dict(zip(nodes, np.bincount(indices, minlength=len(nodes)).tolist()))
     
     def calculate_degree_score(self, node: str) -> float:
         """
@@ -84,17 +100,34 @@ class SpamScorer:
         """
         Calculate spam scores for all nodes.
         
+        Applies the calculate_degree_score() rules to every node at once,
+        using degrees read from the graph's CSR arrays.
+        
         Args:
             None
         
         Returns:
             Dictionary mapping node → spam_score
         """
-        scores = {}
-        for node in self.graph.get_nodes():
-            scores[node] = self.calculate_combined_score(node)
+        nodes, indptr, indices, _ = self.graph.to_csr()
+        out_deg = np.diff(indptr)
+        in_deg = np.bincount(indices, minlength=len(nodes))
+        
+        # Same formulas as calculate_degree_score(), one array per branch
+        broadcaster = np.minimum(100, 35 + (out_deg * 5))
+        ratio = out_deg / (in_deg + 1)
+        ratio_score = normalize_score(np.log(ratio + 1), 0, 3, 0, 100)
+        
+        scores = np.where(in_deg == 0, broadcaster, ratio_score)
+        scores = np.where(out_deg < MIN_SPAM_OUT_DEGREE, 0, np.clip(scores, 0, 100))
+        
+        # Branches that give an int in calculate_degree_score() give one here
+        values = scores.tolist()
+        integral = (out_deg < MIN_SPAM_OUT_DEGREE) | (in_deg == 0) | (ratio_score >= 100)
+        for i in np.flatnonzero(integral).tolist():
+            values[i] = int(values[i])
         
-        return scores
+        return dict(zip(nodes, values))
     
     def get_score_components(self, node: str) -> dict:
         """
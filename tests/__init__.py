@@ -0,0 +1 @@
+"""Tests for the email spam detection system."""
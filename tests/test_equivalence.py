@@ -0,0 +1,314 @@
+"""
+Randomized checks that the fast code paths agree with their reference versions.
+
+Each test builds small random inputs from a fixed seed and compares the
+optimized implementation against the straightforward one it replaced.
+
+Run from the project root:
+    python -m unittest discover tests
+"""
+import os
+import random
+import tempfile
+import unittest
+
+import networkx as nx
+import numpy as np
+
+from algorithms.metrics.network_metrics import diameter, diameter_and_radius, radius
+from algorithms.shortest_paths import bidirectional_search, build_path_index, dijkstra_indexed
+from core.directed_graph import DirectedEmailGraph
+from data.email_parser import EmailParser
+from detection.spam_classifier import SpamClassifier
+from detection.spam_scorer import SpamScorer
+from web_gui_tabbed import BUCKET_LABELS, build_top_spam
+
+# Random graphs per test (each one small enough for NetworkX to check quickly)
+TRIALS = 40
+
+
+def random_emails(rng, max_nodes=30, max_rows=80):
+    """Random (sender, recipient, count) rows over a small address pool."""
+    num_nodes = rng.randint(2, max_nodes)
+    addresses = [f'user{i}@example.com' for i in range(num_nodes)]
+    return [
+        (rng.choice(addresses), rng.choice(addresses), rng.randint(1, 9))
+        for _ in range(rng.randint(1, max_rows))
+    ]
+
+
+def random_hub_emails(rng):
+    """Random rows where a few senders mail many recipients, like the spam datasets."""
+    addresses = [f'user{i}@example.com' for i in range(rng.randint(2, 90))]
+    emails = []
+    for hub in rng.sample(addresses, min(3, len(addresses))):
+        for recipient in rng.sample(addresses, rng.randint(0, len(addresses))):
+            emails.append((hub, recipient, 1))
+    return emails + random_emails(rng, max_rows=40)
+
+
+def build_graph(emails):
+    """Reference graph built one email at a time."""
+    graph = DirectedEmailGraph()
+    graph.add_emails_batch(emails)
+    return graph
+
+
+class TestShortestPaths(unittest.TestCase):
+    """bidirectional_search() and dijkstra_indexed() against NetworkX Dijkstra."""
+
+    def test_path_cost_matches_networkx(self):
+        rng = random.Random(0)
+        for _ in range(TRIALS):
+            graph = build_graph(random_emails(rng))
+            path_index = build_path_index(graph)
+            nodes = path_index['nodes']
+            indptr, indices, costs = path_index['forward']
+
+            reference = nx.DiGraph()
+            reference.add_nodes_from(range(len(nodes)))
+            for u in range(len(nodes)):
+                for k in range(indptr[u], indptr[u + 1]):
+                    reference.add_edge(u, indices[k], cost=costs[k])
+
+            for _ in range(10):
+                src = rng.randrange(len(nodes))
+                tgt = rng.randrange(len(nodes))
+                hops = bidirectional_search(path_index['forward'], path_index['reverse'], src, tgt)
+                if not nx.has_path(reference, src, tgt):
+                    self.assertIsNone(hops)
+                    continue
+
+                expected = nx.dijkstra_path_length(reference, src, tgt, weight='cost')
+                self.assertEqual(hops[0], src)
+                self.assertEqual(hops[-1], tgt)
+                cost = sum(reference[u][v]['cost'] for u, v in zip(hops, hops[1:]))
+                self.assertAlmostEqual(cost, expected)
+
+    def test_distance_sums_original_weights(self):
+        rng = random.Random(1)
+        for _ in range(TRIALS):
+            graph = build_graph(random_emails(rng))
+            path_index = build_path_index(graph)
+            nodes = path_index['nodes']
+            for _ in range(10):
+                source = rng.choice(nodes)
+                target = rng.choice(nodes)
+                path, distance = dijkstra_indexed(path_index, source, target)
+                if path is None:
+                    self.assertIsNone(distance)
+                    continue
+                expected = sum(graph.get_edge_weight(u, v) for u, v in zip(path, path[1:]))
+                self.assertEqual(distance, expected)
+
+    def test_fractional_weights_are_not_truncated(self):
+        graph = DirectedEmailGraph()
+        graph.add_email('a@example.com', 'b@example.com', 1.5)
+        graph.add_email('b@example.com', 'c@example.com', 2.5)
+        path_index = build_path_index(graph)
+        path, distance = dijkstra_indexed(path_index, 'a@example.com', 'c@example.com')
+        self.assertEqual(path, ['a@example.com', 'b@example.com', 'c@example.com'])
+        self.assertEqual(distance, 4.0)
+
+
+class TestFromArrays(unittest.TestCase):
+    """DirectedEmailGraph.from_arrays() against add_emails_batch()."""
+
+    def test_matches_batch_build(self):
+        rng = random.Random(2)
+        for _ in range(TRIALS):
+            emails = random_emails(rng)
+            expected = build_graph(emails)
+            senders, recipients, counts = zip(*emails)
+            graph = DirectedEmailGraph.from_arrays(
+                np.array(senders), np.array(recipients), np.array(counts)
+            )
+
+            self.assertEqual(graph.get_nodes(), expected.get_nodes())
+            self.assertEqual(graph.get_edges(), expected.get_edges())
+            self.assertEqual(graph.get_weighted_edges(), expected.get_weighted_edges())
+
+            nodes, indptr, indices, weights = graph.to_csr()
+            expected_nodes, expected_indptr, expected_indices, expected_weights = expected.to_csr()
+            self.assertEqual(nodes, expected_nodes)
+            np.testing.assert_array_equal(indptr, expected_indptr)
+            np.testing.assert_array_equal(indices, expected_indices)
+            np.testing.assert_array_equal(weights, expected_weights)
+
+    def test_fractional_weights(self):
+        rng = random.Random(7)
+        for _ in range(TRIALS):
+            emails = [(s, r, rng.randint(1, 20) / 4) for s, r, _ in random_emails(rng)]
+            expected = build_graph(emails)
+            senders, recipients, counts = zip(*emails)
+            graph = DirectedEmailGraph.from_arrays(
+                np.array(senders), np.array(recipients), np.array(counts)
+            )
+            self.assertEqual(graph.get_weighted_edges(), expected.get_weighted_edges())
+            np.testing.assert_array_equal(graph.to_csr()[3], expected.to_csr()[3])
+
+        graph = DirectedEmailGraph.from_arrays(['a', 'a'], ['b', 'b'], [1.5, 1.25])
+        self.assertEqual(graph.get_edge_weight('a', 'b'), 2.75)
+
+    def test_default_weights(self):
+        rng = random.Random(3)
+        emails = [(s, r, 1) for s, r, _ in random_emails(rng)]
+        senders, recipients, _ = zip(*emails)
+        graph = DirectedEmailGraph.from_arrays(np.array(senders), np.array(recipients))
+        self.assertEqual(graph.get_weighted_edges(), build_graph(emails).get_weighted_edges())
+
+
+class TestParseCsvFast(unittest.TestCase):
+    """EmailParser.parse_csv_fast() against parse_csv()."""
+
+    # Count cells parse_csv() reads as integers, and ones it falls back to 1 on
+    COUNTS = ['1', '7', ' 12 ', '+3', '-2', '0', '', 'abc', '2.5', 'many']
+    ADDRESSES = ['a@example.com', ' b@example.com', 'c@example.com ', '', '  ']
+
+    def write_csv(self, header, rows):
+        handle, path = tempfile.mkstemp(suffix='.csv')
+        with os.fdopen(handle, 'w', encoding='utf-8') as f:
+            f.write(header + '\n')
+            for row in rows:
+                f.write(','.join(row) + '\n')
+        self.addCleanup(os.remove, path)
+        return path
+
+    def check(self, path):
+        expected = EmailParser.parse_csv(path)
+        emails = EmailParser.parse_csv_fast(path)
+        actual = [
+            (sender, recipient, int(count))
+            for sender, recipient, count in emails.itertuples(index=False)
+        ]
+        self.assertEqual(actual, expected)
+
+    def test_matches_parse_csv(self):
+        rng = random.Random(4)
+        headers = ['sender,recipient,count', 'Sender, Recipient ,Frequency', 'recipient,sender,number']
+        for _ in range(TRIALS):
+            header = rng.choice(headers)
+            rows = [('a@example.com', 'b@example.com', '1')]
+            for _ in range(rng.randint(1, 30)):
+                rows.append((
+                    rng.choice(self.ADDRESSES), rng.choice(self.ADDRESSES), rng.choice(self.COUNTS)
+                ))
+            self.check(self.write_csv(header, rows))
+
+    def test_without_count_column(self):
+        rng = random.Random(5)
+        rows = [('a@example.com', 'b@example.com')]
+        rows += [(rng.choice(self.ADDRESSES), rng.choice(self.ADDRESSES)) for _ in range(30)]
+        self.check(self.write_csv('sender,recipient', rows))
+
+
+class TestEccentricities(unittest.TestCase):
+    """diameter() and radius() against NetworkX on the largest component."""
+
+    def test_matches_networkx(self):
+        rng = random.Random(6)
+        for _ in range(TRIALS):
+            graph = build_graph(random_emails(rng, max_rows=40))
+            undirected = graph.to_networkx().to_undirected()
+            largest = undirected.subgraph(max(nx.connected_components(undirected), key=len))
+
+            expected = (nx.diameter(largest), nx.radius(largest))
+            self.assertEqual((diameter(graph), radius(graph)), expected)
+            self.assertEqual(diameter_and_radius(graph), expected)
+
+    def test_empty_graph(self):
+        graph = DirectedEmailGraph()
+        self.assertEqual(diameter_and_radius(graph), (0, 0))
+        self.assertEqual(diameter(graph), 0)
+        self.assertEqual(radius(graph), 0)
+
+
+class TestSpamScorer(unittest.TestCase):
+    """SpamScorer.calculate_all_scores() against the per-node calculate_degree_score()."""
+
+    def test_matches_per_node_scores(self):
+        rng = random.Random(8)
+        for _ in range(TRIALS):
+            graph = build_graph(random_hub_emails(rng))
+            scorer = SpamScorer(graph)
+            scores = scorer.calculate_all_scores()
+            self.assertEqual(list(scores), graph.get_nodes())
+            for node, score in scores.items():
+                expected = scorer.calculate_degree_score(node)
+                self.assertAlmostEqual(score, expected, places=9)
+                # Ints stay ints, so payloads read 85 rather than 85.0
+                self.assertIs(type(score), type(expected))
+
+    def test_empty_graph(self):
+        self.assertEqual(SpamScorer(DirectedEmailGraph()).calculate_all_scores(), {})
+
+
+class TestClassifier(unittest.TestCase):
+    """SpamClassifier.classify_array() and its summary against classify_node()."""
+
+    def random_scores(self, rng):
+        # Thresholds and their neighbours are mixed in to exercise the boundaries
+        edges = [0, 39.999, 40, 40.001, 79.999, 80, 80.001, 100]
+        return {
+            f'user{i}@example.com': rng.choice(edges) if rng.random() < 0.3 else rng.uniform(0, 100)
+            for i in range(rng.randint(0, 60))
+        }
+
+    def test_classify_array(self):
+        rng = random.Random(9)
+        classifier = SpamClassifier()
+        buckets = {'legitimate': 0, 'suspicious': 1, 'spam': 2}
+        for _ in range(TRIALS):
+            scores = list(self.random_scores(rng).values())
+            expected = [buckets[classifier.classify_node(score)] for score in scores]
+            actual = classifier.classify_array(np.array(scores, dtype=np.float64))
+            self.assertEqual(actual.tolist(), expected)
+
+    def test_classification_summary(self):
+        rng = random.Random(10)
+        classifier = SpamClassifier()
+        for _ in range(TRIALS):
+            scores = self.random_scores(rng)
+            labels = list(classifier.classify_all_nodes(scores).values())
+            total = len(scores)
+            summary = classifier.get_classification_summary(scores)
+            self.assertEqual(summary['total_nodes'], total)
+            for label in ('spam', 'suspicious', 'legitimate'):
+                count = labels.count(label)
+                self.assertEqual(summary[f'{label}_count'], count)
+                self.assertAlmostEqual(
+                    summary[f'{label}_percentage'], count / total * 100 if total else 0
+                )
+
+
+class TestTopSpam(unittest.TestCase):
+    """build_top_spam() against a full stable sort of every node's score."""
+
+    def test_matches_full_sort(self):
+        rng = random.Random(11)
+        classifier = SpamClassifier()
+        for _ in range(TRIALS):
+            nodes = [f'user{i}@example.com' for i in range(rng.randint(0, 60))]
+            # Few distinct values, so ties at the cut-off are common
+            scores = {node: rng.choice([0, 40, 55.5, 60, 80, 85, 100]) for node in nodes}
+            values = np.fromiter(scores.values(), dtype=np.float64, count=len(scores))
+            buckets = classifier.classify_array(values).astype(np.uint8)
+
+            expected = sorted(
+                (
+                    {'email': node, 'score': score,
+                     'classification': classifier.classify_node(score).capitalize()}
+                    for node, score in scores.items()
+                ),
+                key=lambda row: row['score'], reverse=True
+            )[:15]
+            actual = build_top_spam(scores, nodes, values, buckets)
+            self.assertEqual(actual, expected)
+            self.assertEqual(
+                [type(row['score']) for row in actual], [type(row['score']) for row in expected]
+            )
+            self.assertTrue(set(row['classification'] for row in actual) <= set(BUCKET_LABELS))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,151 @@
+"""
+HTTP caching checks for the web GUI: ETags, 304s and pre-compressed bodies.
+
+Run from the project root:
+    python -m unittest discover tests
+"""
+import gzip
+import unittest
+
+import brotli
+import ormsgpack
+import orjson
+
+import web_gui_tabbed
+
+# Accept-Encoding value → Content-Encoding the response should carry
+ENCODINGS = {'br': 'br', 'gzip': 'gzip', 'identity': None}
+
+DECODERS = {'br': brotli.decompress, 'gzip': gzip.decompress, None: lambda body: body}
+
+MSGPACK = {'Accept': 'application/msgpack'}
+
+
+class WebGuiTestCase(unittest.TestCase):
+    """Loads the combined dataset once for the whole class."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.client = web_gui_tabbed.app.test_client()
+        response = cls.client.get('/api/load-dataset/combined')
+        assert response.status_code == 200, response.data
+        cls.loaded = web_gui_tabbed.current_data
+
+    def get(self, path, accept_encoding, headers=None, if_none_match=None):
+        headers = {'Accept-Encoding': accept_encoding, **(headers or {})}
+        if if_none_match:
+            headers['If-None-Match'] = f'"{if_none_match}"'
+        return self.client.get(path, headers=headers)
+
+    def assert_revalidates(self, path, headers=None):
+        """A 200 and the 304 answering its ETag carry the same validator and headers"""
+        for accept_encoding, encoding in ENCODINGS.items():
+            with self.subTest(path=path, encoding=accept_encoding):
+                response = self.get(path, accept_encoding, headers)
+                self.assertEqual(response.status_code, 200)
+                self.assertEqual(response.headers.get('Content-Encoding'), encoding)
+                etag, _ = response.get_etag()
+                if encoding:
+                    self.assertTrue(etag.endswith(f':{encoding}'))
+                else:
+                    self.assertNotIn(':', etag)
+
+                revalidated = self.get(path, accept_encoding, headers, if_none_match=etag)
+                self.assertEqual(revalidated.status_code, 304)
+                self.assertEqual(revalidated.get_etag(), response.get_etag())
+                self.assertEqual(
+                    revalidated.headers['Cache-Control'], response.headers['Cache-Control']
+                )
+                self.assertIn('Accept-Encoding', revalidated.vary)
+
+    def assert_matches_other_encodings(self, path, headers=None):
+        """A tag handed out for one encoding still validates a request for another"""
+        base = self.get(path, 'identity', headers).get_etag()[0]
+        for tag in (f'{base}:br', f'{base}:gzip', base):
+            for accept_encoding, encoding in ENCODINGS.items():
+                with self.subTest(path=path, tag=tag, encoding=accept_encoding):
+                    response = self.get(path, accept_encoding, headers, if_none_match=tag)
+                    self.assertEqual(response.status_code, 304)
+                    expected = f'{base}:{encoding}' if encoding else base
+                    self.assertEqual(response.get_etag()[0], expected)
+
+
+class TestIndexCaching(WebGuiTestCase):
+    """ETags and pre-compressed bodies for the main page."""
+
+    def test_304_sends_the_200_validator(self):
+        self.assert_revalidates('/')
+
+    def test_suffixed_tags_match(self):
+        self.assert_matches_other_encodings('/')
+
+    def test_bodies_decode_to_the_page(self):
+        for accept_encoding, encoding in ENCODINGS.items():
+            with self.subTest(encoding=accept_encoding):
+                response = self.get('/', accept_encoding)
+                self.assertEqual(DECODERS[encoding](response.data), web_gui_tabbed._CACHED_HTML)
+
+
+class TestGraphDataCaching(WebGuiTestCase):
+    """ETags and pre-compressed bodies for /api/graph-data in JSON and MessagePack."""
+
+    def test_304_sends_the_200_validator(self):
+        self.assert_revalidates('/api/graph-data')
+        self.assert_revalidates('/api/graph-data', MSGPACK)
+
+    def test_suffixed_tags_match(self):
+        self.assert_matches_other_encodings('/api/graph-data')
+        self.assert_matches_other_encodings('/api/graph-data', MSGPACK)
+
+    def test_json_and_msgpack_tags_differ(self):
+        json_etag = self.get('/api/graph-data', 'identity').get_etag()[0]
+        msgpack_etag = self.get('/api/graph-data', 'identity', MSGPACK).get_etag()[0]
+        self.assertEqual(json_etag, self.loaded['etag'])
+        self.assertEqual(msgpack_etag, self.loaded['etag'] + '-msgpack')
+
+        # A cached JSON copy must not satisfy a MessagePack request, or the reverse
+        response = self.get('/api/graph-data', 'br', MSGPACK, if_none_match=f'{json_etag}:br')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.mimetype, 'application/msgpack')
+        response = self.get('/api/graph-data', 'br', if_none_match=f'{msgpack_etag}:br')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.mimetype, 'application/json')
+
+    def test_bodies_decode_to_the_cached_payload(self):
+        expected = orjson.loads(self.loaded['responses']['graph-data'])
+        for accept_encoding, encoding in ENCODINGS.items():
+            with self.subTest(encoding=accept_encoding):
+                response = self.get('/api/graph-data', accept_encoding)
+                self.assertEqual(orjson.loads(DECODERS[encoding](response.data)), expected)
+
+                response = self.get('/api/graph-data', accept_encoding, MSGPACK)
+                self.assertEqual(ormsgpack.unpackb(DECODERS[encoding](response.data)), expected)
+
+
+class TestCachedBodies(WebGuiTestCase):
+    """Content-Encoding of the bodies serialized once per load."""
+
+    ENDPOINTS = {
+        'stats': '/api/stats',
+        'metrics': '/api/metrics',
+        'top-spam': '/api/top-spam',
+        'bootstrap': '/api/bootstrap',
+    }
+
+    def test_precompressed_copies(self):
+        for key, path in self.ENDPOINTS.items():
+            body = self.loaded['responses'][key]
+            for accept_encoding, encoding in ENCODINGS.items():
+                with self.subTest(path=path, encoding=accept_encoding):
+                    response = self.get(path, accept_encoding)
+                    self.assertEqual(response.status_code, 200)
+                    if key not in self.loaded['encoded']:
+                        # Below the compression threshold: always sent as-is
+                        encoding = None
+                    self.assertEqual(response.headers.get('Content-Encoding'), encoding)
+                    self.assertEqual(DECODERS[encoding](response.data), body)
+                    self.assertIn('Accept-Encoding', response.vary)
+
+
+if __name__ == '__main__':
+    unittest.main()